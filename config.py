@@ -0,0 +1,25 @@
+"""Extra Flask configuration for Warbler."""
+
+
+class TestConfig:
+    """Settings for running the test suite.
+
+    app.py loads these when FLASK_ENV is "testing", before any extensions
+    are set up, so they see the test values from the start.
+    """
+
+    TESTING = True
+    PROPAGATE_EXCEPTIONS = True
+
+    # Don't have WTForms use CSRF at all, since it's a pain to test
+    WTF_CSRF_ENABLED = False
+
+    DEBUG_TB_ENABLED = False
+    TEMPLATES_AUTO_RELOAD = False
+
+    SQLALCHEMY_ECHO = False
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # bcrypt's cost doubles with every round; the tests don't care how
+    # strong the hashes are, so use the minimum instead of the default 12
+    BCRYPT_LOG_ROUNDS = 4
@@ -0,0 +1,190 @@
+"""Shared pytest fixtures for the Warbler tests.
+
+These point the app at a test database and create our tables once for all
+tests --- each test runs in a transaction that is rolled back afterwards,
+so there's no data to delete between tests.
+"""
+
+# run the whole suite in parallel like:
+#
+#    python -m pytest -n auto --dist loadscope
+
+import os
+
+import pytest
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine.url import make_url
+
+from models import db, bcrypt, User
+from sample_data import TESTUSER_ID, U1_ID, U2_ID, U3_ID
+
+# BEFORE we import our app, let's set an environmental variable
+# to use a different database for tests (we need to do this
+# before we import our app, since that will have already
+# connected to the database
+#
+# Set TEST_DATABASE_URL to run against another cluster (see
+# postgresql.test.conf). The worker id is appended to its database name,
+# so under pytest-xdist every worker gets its own database and workers
+# never see each other's data. Runs without xdist count as worker "gw0":
+# the default URL really means the database warbler-test_gw0, not
+# warbler-test. The _db fixture creates it if it's missing.
+
+TEST_DATABASE_URL = make_url(os.environ.get(
+    'TEST_DATABASE_URL', "postgresql:///warbler-test"))
+WORKER_ID = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+TEST_DATABASE_URL.database = f"{TEST_DATABASE_URL.database}_{WORKER_ID}"
+os.environ['DATABASE_URL'] = str(TEST_DATABASE_URL)
+
+# ...and have the app load config.TestConfig
+
+os.environ['FLASK_ENV'] = 'testing'
+
+from app import app as flask_app
+
+
+def create_database(url):
+    """Create the database at `url` unless it already exists."""
+
+    url = make_url(url)
+    name = url.database
+
+    # CREATE DATABASE can't run inside a transaction, and has to be issued
+    # from some other database on the same server
+    url.database = 'postgres'
+    engine = create_engine(url, isolation_level='AUTOCOMMIT')
+
+    with engine.connect() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"),
+            name=name).scalar()
+        if not exists:
+            conn.execute(f'CREATE DATABASE "{name}"')
+
+    engine.dispose()
+
+
+def truncate_tables():
+    """Empty every table in one statement.
+
+    For data committed outside a test's SAVEPOINT: a single TRUNCATE is
+    far cheaper than a DELETE per table or rebuilding the tables.
+    """
+
+    tables = ", ".join(table.name for table in db.metadata.sorted_tables)
+    db.session.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+    db.session.commit()
+
+
+@pytest.fixture(scope='session')
+def app():
+    """The Flask app, shared by every test in this worker.
+
+    Compiled templates are kept in Jinja's on-disk bytecode cache, so
+    parallel workers and later runs skip compiling them again.
+    """
+
+    flask_app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+    return flask_app
+
+
+@pytest.fixture(scope='session')
+def shared_client(app):
+    """One test client, reused by every test in this worker."""
+
+    return app.test_client()
+
+
+@pytest.fixture
+def client(shared_client):
+    """The shared test client, logged out.
+
+    Clearing its cookies throws away the Flask session, which is the only
+    state a client carries between requests.
+    """
+
+    shared_client.cookie_jar.clear()
+
+    return shared_client
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _db(app):
+    """Create this worker's database and our tables, once per worker."""
+
+    create_database(app.config['SQLALCHEMY_DATABASE_URI'])
+    db.drop_all()
+    db.create_all()
+
+    return db
+
+
+@pytest.fixture(scope='session')
+def base_users(_db):
+    """Add the sample users, once per worker.
+
+    They're committed outside of each test's transaction, so they survive
+    every rollback; tests should only read them.
+
+    Only testuser goes through User.signup (test_login logs in as them);
+    the others all share one precomputed hash of "password".
+    """
+
+    testuser = User.signup(username="testuser",
+                           email="test@test.com",
+                           password="testuser",
+                           image_url=None)
+    testuser.id = TESTUSER_ID
+
+    hashed_pwd = bcrypt.generate_password_hash("password").decode('UTF-8')
+
+    _db.session.add_all([
+        User(id=U1_ID, username="user1", email="user1@user.com",
+             password=hashed_pwd, image_url=None),
+        User(id=U2_ID, username="user2", email="user2@user.com",
+             password=hashed_pwd, image_url=None),
+        User(id=U3_ID, username="user3", email="user3@user.com",
+             password=hashed_pwd, image_url=None),
+    ])
+
+    _db.session.commit()
+
+    yield
+
+    truncate_tables()
+
+
+@pytest.fixture(autouse=True)
+def db_session(_db, base_users):
+    """Run the test inside a transaction that is rolled back afterwards.
+
+    db.session is bound to a connection-level transaction with a SAVEPOINT
+    on top, so app code can commit (and roll back) as it normally would.
+    """
+
+    orig_session = _db.session
+    connection = _db.engine.connect()
+    trans = connection.begin()
+
+    session = _db.create_scoped_session(
+        options={'bind': connection, 'binds': {}})
+    session.begin_nested()
+
+    # app code calls db.session.commit(), which releases our SAVEPOINT;
+    # open a new one so a later rollback still stays inside the test
+    @event.listens_for(session, 'after_transaction_end')
+    def restart_savepoint(sess, transaction):
+        if transaction.nested and not transaction._parent.nested:
+            sess.expire_all()
+            sess.begin_nested()
+
+    _db.session = session
+
+    yield session
+
+    session.remove()
+    trans.rollback()
+    connection.close()
+    _db.session = orig_session
@@ -0,0 +1,38 @@
+#!/bin/sh
+# Start a throwaway PostgreSQL cluster for the Warbler tests, kept entirely
+# in RAM (tmpfs) and running with the settings from postgresql.test.conf.
+#
+# run it like:
+#
+#    ./pg-test-cluster.sh
+#    TEST_DATABASE_URL=postgresql://localhost:55432/warbler-test python -m pytest
+#
+# The tests create their databases themselves. Set WARBLER_TEST_PGDATA
+# and WARBLER_TEST_PGPORT to change where the cluster lives and listens
+# (the generic PGDATA/PGPORT are ignored, since they usually point at a
+# real cluster).
+#
+# The server's Unix socket goes in the data directory too: the packaged
+# default (/var/run/postgresql on Debian/Ubuntu) is only writable by the
+# postgres user. The printed TEST_DATABASE_URL connects over TCP, and
+# pg_ctl stop finds the server through its pid file, so neither needs to
+# know where the socket is.
+#
+# Everything in it is lost on reboot, which is the point.
+
+set -e
+
+DATA_DIR="${WARBLER_TEST_PGDATA:-/dev/shm/warbler-pgdata}"
+PORT="${WARBLER_TEST_PGPORT:-55432}"
+HERE="$(cd "$(dirname "$0")" && pwd)"
+
+if [ ! -f "$DATA_DIR/PG_VERSION" ]; then
+    mkdir -p "$DATA_DIR"
+    initdb -D "$DATA_DIR" --auth=trust --username="$(whoami)" > /dev/null
+    echo "include '$HERE/postgresql.test.conf'" >> "$DATA_DIR/postgresql.conf"
+fi
+
+pg_ctl -D "$DATA_DIR" -o "-p $PORT -k '$DATA_DIR'" -l "$DATA_DIR/server.log" -w start
+
+echo "TEST_DATABASE_URL=postgresql://localhost:$PORT/warbler-test"
+echo "stop it with: pg_ctl -D $DATA_DIR stop"
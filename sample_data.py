@@ -0,0 +1,10 @@
+"""Ids of the sample users the tests can rely on.
+
+conftest's base_users fixture adds these users once per test run; the
+test modules import the ids from here.
+"""
+
+TESTUSER_ID = 8989
+U1_ID = 123
+U2_ID = 234
+U3_ID = 345
@@ -2,64 +2,37 @@
 
 # run these tests like:
 #
-#    python -m unittest test_message_model.py
+#    python -m pytest test_message_model.py
 
 
-import os
 from unittest import TestCase
 
-from models import db, User, Message, Follows
+import pytest
 
-# BEFORE we import our app, let's set an environmental variable
-# to use a different database for tests (we need to do this
-# before we import our app, since that will have already
-# connected to the database
-
-os.environ['DATABASE_URL'] = "postgresql:///warbler-test"
-from app import app, CURR_USER_KEY
-
-
-# Now we can import app
-
-from app import app
-
-# Create our tables (we do this here, so we only create the tables
-# once for all tests --- in each test, we'll delete the data
-# and create fresh new clean test data
-
-db.drop_all()
-db.create_all()
+from models import db, Message
+from sample_data import TESTUSER_ID
+from app import CURR_USER_KEY
 
 
 class MessageModelTestCase(TestCase):
     """Test views for messages."""
 
-    def setUp(self):
-        """Create test client, add sample data."""
-
-        User.query.delete()
-        Message.query.delete()
-        Follows.query.delete()
-
-        self.client = app.test_client()
-
-        self.testuser = User.signup(username="testuser",
-                                    email="test@test.com",
-                                    password="testuser",
-                                    image_url=None)
+    testuser_id = TESTUSER_ID
 
-        db.session.commit()
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        self.client = client
 
     def test_message_model(self):
         """Does basic model work?"""
 
         with self.client as c:
             with c.session_transaction() as sess:
-                sess[CURR_USER_KEY] = self.testuser.id
+                sess[CURR_USER_KEY] = self.testuser_id
 
                 m = Message(
                     text="testMessageModel",
-                    user_id = self.testuser.id
+                    user_id = self.testuser_id
                 )
 
                 db.session.add(m)
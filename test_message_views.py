@@ -2,55 +2,26 @@
 
 # run these tests like:
 #
-#    FLASK_ENV=production python -m unittest test_message_views.py
+#    python -m pytest test_message_views.py
 
 
-import os
 from unittest import TestCase
 
-from models import db, connect_db, Message, User
+import pytest
 
-# BEFORE we import our app, let's set an environmental variable
-# to use a different database for tests (we need to do this
-# before we import our app, since that will have already
-# connected to the database
-
-os.environ['DATABASE_URL'] = "postgresql:///warbler-test"
-
-
-# Now we can import app
-
-from app import app, CURR_USER_KEY
-
-# Create our tables (we do this here, so we only create the tables
-# once for all tests --- in each test, we'll delete the data
-# and create fresh new clean test data
-
-db.drop_all()
-db.create_all()
-
-# Don't have WTForms use CSRF at all, since it's a pain to test
-
-app.config['WTF_CSRF_ENABLED'] = False
+from models import db, Message
+from sample_data import TESTUSER_ID
+from app import CURR_USER_KEY
 
 
 class MessageViewTestCase(TestCase):
     """Test views for messages."""
 
-    def setUp(self):
-        """Create test client, add sample data."""
-
-        User.query.delete()
-        Message.query.delete()
-
-        self.client = app.test_client()
-
-        self.testuser = User.signup(username="testuser",
-                                    email="test@test.com",
-                                    password="testuser",
-                                    image_url=None)
+    testuser_id = TESTUSER_ID
 
-        db.session.commit()
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        self.client = client
 
     def test_add_message(self):
         """Can use add a message?"""
@@ -60,7 +31,7 @@ class MessageViewTestCase(TestCase):
 
         with self.client as c:
             with c.session_transaction() as sess:
-                sess[CURR_USER_KEY] = self.testuser.id
+                sess[CURR_USER_KEY] = self.testuser_id
 
             # Now, that session setting is saved, so we can have
             # the rest of ours test
@@ -78,7 +49,7 @@ class MessageViewTestCase(TestCase):
 
         with self.client as c:
             with c.session_transaction() as sess:
-                sess[CURR_USER_KEY] = self.testuser.id
+                sess[CURR_USER_KEY] = self.testuser_id
 
             # Now, that session setting is saved, so we can have
             # the rest of ours test
@@ -97,7 +68,7 @@ class MessageViewTestCase(TestCase):
 
         with self.client as c:
             with c.session_transaction() as sess:
-                sess[CURR_USER_KEY] = self.testuser.id
+                sess[CURR_USER_KEY] = self.testuser_id
 
             # Now, that session setting is saved, so we can have
             # the rest of ours test
@@ -2,52 +2,23 @@
 
 # run these tests like:
 #
-#    python -m unittest test_user_model.py
+#    python -m pytest test_user_model.py
 
 
-import os
 from unittest import TestCase
 
-from models import db, User, Message, Follows
-
-# BEFORE we import our app, let's set an environmental variable
-# to use a different database for tests (we need to do this
-# before we import our app, since that will have already
-# connected to the database
-
-os.environ['DATABASE_URL'] = "postgresql:///warbler-test"
-
-
-# Now we can import app
-
-from app import app
-
-# Create our tables (we do this here, so we only create the tables
-# once for all tests --- in each test, we'll delete the data
-# and create fresh new clean test data
-
-db.drop_all()
-db.create_all()
+from models import db, User
 
 
 class UserModelTestCase(TestCase):
     """Test views for messages."""
 
-    def setUp(self):
-        """Create test client, add sample data."""
-
-        User.query.delete()
-        Message.query.delete()
-        Follows.query.delete()
-
-        self.client = app.test_client()
-
     def test_user_model(self):
         """Does basic model work?"""
 
         u = User(
-            email="test@test.com",
-            username="testuser",
+            email="model@test.com",
+            username="modeluser",
             password="HASHED_PASSWORD"
         )
 